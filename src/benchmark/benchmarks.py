@@ -0,0 +1,186 @@
+import gc
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from src.core.topology import create_ring_topology, partition_nodes
+from src.core.metrics import calculate_path_score
+from src.core.routing import (find_best_path, multicast_search,
+                              shortest_path_first, get_clockwise_path)
+
+DEFAULT_SIZES = [20, 100, 1000, 10_000, 100_000, 1_000_000]
+ENDPOINT_COUNTS = [(1, 1), (2, 4), (4, 8)]
+PARTITION_SIZE = 5
+WC, WT = 0.7, 0.3
+SEED = 42
+
+
+def spread_endpoints(num_nodes, num_sources, num_targets):
+    """Places sources and targets evenly around the ring, targets offset by half a gap."""
+    sources = [i * num_nodes // num_sources for i in range(num_sources)]
+    targets = [(num_nodes // (2 * num_targets) + i * num_nodes // num_targets) % num_nodes
+               for i in range(num_targets)]
+    return sources, targets
+
+
+def seeded_ring(num_nodes):
+    """Creates a reproducible ring topology."""
+    random.seed(SEED)
+    np.random.seed(SEED)
+    return create_ring_topology(num_nodes)
+
+
+def _bench_create_ring(ring, sources, targets):
+    n = len(ring)
+    return lambda: create_ring_topology(n)
+
+
+def _bench_partition_nodes(ring, sources, targets):
+    return lambda: partition_nodes(ring, PARTITION_SIZE)
+
+
+def _bench_path_score(ring, sources, targets):
+    path = get_clockwise_path(ring, 0, len(ring) // 2)
+    return lambda: calculate_path_score(ring, path, WC, WT)
+
+
+def _bench_multicast_search(ring, sources, targets):
+    return lambda: multicast_search(ring, sources, targets, WC, WT)
+
+
+def _bench_shortest_path_first(ring, sources, targets):
+    return lambda: shortest_path_first(ring, sources, targets)
+
+
+def _bench_find_best_path(ring, sources, targets):
+    return lambda: find_best_path(ring, sources[0], targets[0], WC, WT)
+
+
+def _bench_save_simulation_metrics(ring, sources, targets):
+    from src.visualization.export import save_simulation_metrics
+    paths_tempcon, _ = multicast_search(ring, sources, targets, WC, WT)
+    paths_spf, _ = shortest_path_first(ring, sources, targets)
+    return lambda: save_simulation_metrics(ring, paths_tempcon, paths_spf, WC, WT, 'bench')
+
+
+def _bench_save_node_partition_metrics(ring, sources, targets):
+    from src.visualization.export import save_node_partition_metrics
+    partitions = partition_nodes(ring, PARTITION_SIZE)
+    return lambda: save_node_partition_metrics(ring, partitions, 'bench')
+
+
+# name -> (setup function, largest ring size worth running, varies endpoints)
+# The caps keep the default sweep tractable: find_best_path copies the whole
+# path on every pop and save_node_partition_metrics scans every partition for
+# every node, so both are quadratic in the ring size.
+BENCHMARKS = {
+    'create_ring_topology': (_bench_create_ring, 1_000_000, False),
+    'partition_nodes': (_bench_partition_nodes, 1_000_000, False),
+    'calculate_path_score': (_bench_path_score, 1_000_000, False),
+    'multicast_search': (_bench_multicast_search, 100_000, True),
+    'shortest_path_first': (_bench_shortest_path_first, 1_000_000, True),
+    'find_best_path': (_bench_find_best_path, 10_000, False),
+    'save_simulation_metrics': (_bench_save_simulation_metrics, 100_000, True),
+    'save_node_partition_metrics': (_bench_save_node_partition_metrics, 10_000, False),
+}
+
+
+def measure(func, repeat=5, time_budget=2.0, min_time=0.5):
+    """Times func and records its peak traced memory.
+
+    Runs func at least once and at least `repeat` times, and keeps going until
+    `min_time` seconds have been spent so short benchmarks get enough samples,
+    but stops once `time_budget` seconds are used up. The garbage collector is
+    disabled while timing, as timeit does, so collections triggered by
+    unrelated objects on the heap do not land in the measurement. One extra
+    run under tracemalloc records memory without slowing the timed runs.
+    """
+    times = []
+    began = time.perf_counter()
+    spent = 0.0
+    while not times or ((len(times) < repeat or spent < min_time) and spent < time_budget):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+        # Budgets count the collections between runs, not just the timed part
+        spent = time.perf_counter() - began
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'runs': len(times),
+        'min_s': min(times),
+        'median_s': float(np.median(times)),
+        'peak_bytes': peak,
+    }
+
+
+def run_benchmarks(sizes=None, names=None, repeat=5, time_budget=2.0, min_time=0.5,
+                   keys=None, log=print):
+    """Runs the selected benchmarks over the given ring sizes.
+
+    If `keys` is given, only measurements whose benchmark_key is in it are
+    run. Exporters write their CSV files into a throwaway working directory
+    so the committed results are never touched.
+    """
+    sizes = sorted(sizes or DEFAULT_SIZES)
+    names = names or list(BENCHMARKS)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    records = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            for num_nodes in sizes:
+                ring = None
+                for name in names:
+                    setup, max_nodes, varies_endpoints = BENCHMARKS[name]
+                    if num_nodes > max_nodes:
+                        continue
+                    counts = ENDPOINT_COUNTS if varies_endpoints else ENDPOINT_COUNTS[:1]
+                    for num_sources, num_targets in counts:
+                        record = {
+                            'benchmark': name,
+                            'num_nodes': num_nodes,
+                            'num_sources': num_sources,
+                            'num_targets': num_targets,
+                        }
+                        if keys is not None and benchmark_key(record) not in keys:
+                            continue
+                        if ring is None:
+                            ring = seeded_ring(num_nodes)
+                        sources, targets = spread_endpoints(num_nodes, num_sources, num_targets)
+                        result = measure(setup(ring, sources, targets),
+                                         repeat, time_budget, min_time)
+                        record.update(result)
+                        records.append(record)
+                        log(f"{benchmark_key(record):<60} "
+                            f"{result['median_s'] * 1e3:12.3f} ms "
+                            f"{result['peak_bytes'] / 2**20:10.2f} MiB")
+        finally:
+            os.chdir(cwd)
+    return records
+
+
+def benchmark_key(record):
+    """Identifies a measurement independently of when or where it was taken."""
+    return (f"{record['benchmark']}[n={record['num_nodes']},"
+            f"s={record['num_sources']},t={record['num_targets']}]")
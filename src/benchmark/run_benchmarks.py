@@ -0,0 +1,223 @@
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import datetime, timezone
+
+from src.benchmark.benchmarks import (BENCHMARKS, DEFAULT_SIZES,
+                                      run_benchmarks, benchmark_key)
+
+RESULTS_DIR = 'results/benchmarks'
+BASELINE_PATH = f'{RESULTS_DIR}/baseline.json'
+
+# Slowdowns smaller than this many seconds are never flagged.
+MIN_TIME_DELTA = 5e-3
+# Memory growth below this many bytes is never flagged.
+MIN_MEMORY_DELTA = 64 * 1024
+
+
+def save_results(records, path):
+    """Writes benchmark records and the environment they were taken in to JSON."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    payload = {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'records': records,
+    }
+    with open(path, 'w') as f:
+        json.dump(payload, f, indent=2)
+
+
+def load_results(path):
+    """Loads benchmark records from a JSON file written by save_results."""
+    with open(path) as f:
+        return json.load(f)['records']
+
+
+def relative_spread(record):
+    """Returns how far the median run sits above the fastest, as a fraction."""
+    if record['min_s'] <= 0:
+        return 0.0
+    return record['median_s'] / record['min_s'] - 1
+
+
+def compare_to_baseline(records, baseline, time_threshold=0.5, memory_threshold=0.25):
+    """Returns the measurements that regressed against the baseline.
+
+    A measurement regresses when its fastest run (or peak memory) exceeds the
+    baseline by more than the given fraction and by more than a small absolute
+    margin. For time, the fraction is widened by the larger run-to-run spread
+    of the two measurements, so a benchmark that is noisy on this machine
+    needs a correspondingly larger slowdown to be flagged. Measurements
+    missing from the baseline are ignored.
+    """
+    baseline_by_key = {benchmark_key(r): r for r in baseline}
+    regressions = []
+    for record in records:
+        key = benchmark_key(record)
+        old = baseline_by_key.get(key)
+        if old is None:
+            continue
+        noise = max(relative_spread(old), relative_spread(record))
+        checks = [
+            ('time', 'min_s', time_threshold + noise, MIN_TIME_DELTA),
+            ('memory', 'peak_bytes', memory_threshold, MIN_MEMORY_DELTA),
+        ]
+        for metric, field, threshold, min_delta in checks:
+            before, after = old[field], record[field]
+            if after - before > min_delta and after > before * (1 + threshold):
+                regressions.append({
+                    'key': key,
+                    'metric': metric,
+                    'baseline': before,
+                    'current': after,
+                    'ratio': after / before if before else float('inf'),
+                })
+    return regressions
+
+
+def recheck_regressions(records, baseline, args, log=print):
+    """Re-measures flagged benchmarks before reporting them.
+
+    Each re-run keeps the faster of the old and new measurements for every
+    flagged key, so a slowdown caused by a transient disturbance disappears
+    while a real regression stays. Returns the regressions that survive all
+    `args.recheck` rounds.
+    """
+    by_key = {benchmark_key(r): r for r in records}
+    regressions = compare_to_baseline(records, baseline,
+                                      args.time_threshold, args.memory_threshold)
+    for round_number in range(1, args.recheck + 1):
+        flagged = {r['key'] for r in regressions if r['metric'] == 'time'}
+        if not flagged:
+            break
+        log(f"\nRe-checking {len(flagged)} flagged measurement(s), round {round_number}")
+        rerun = run_benchmarks(sorted({by_key[k]['num_nodes'] for k in flagged}),
+                               sorted({by_key[k]['benchmark'] for k in flagged}),
+                               args.repeat, args.time_budget, args.min_time,
+                               keys=flagged, log=log)
+        for record in rerun:
+            old = by_key[benchmark_key(record)]
+            if record['min_s'] < old['min_s']:
+                old.update(record)
+        regressions = compare_to_baseline(records, baseline,
+                                          args.time_threshold, args.memory_threshold)
+    return regressions
+
+
+def plot_scaling(records, save_dir):
+    """Plots time and peak memory against ring size for every benchmark."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    os.makedirs(save_dir, exist_ok=True)
+    series = {}
+    for record in records:
+        label = record['benchmark']
+        if record['num_sources'] != 1 or record['num_targets'] != 1:
+            label += f" (s={record['num_sources']}, t={record['num_targets']})"
+        series.setdefault(label, []).append(record)
+
+    for field, ylabel, filename, scale in [
+        ('median_s', 'Median Time (s)', 'scaling_time.png', 1),
+        ('peak_bytes', 'Peak Traced Memory (MiB)', 'scaling_memory.png', 2**20),
+    ]:
+        fig, ax = plt.subplots(figsize=(12, 8))
+        for i, (label, points) in enumerate(sorted(series.items())):
+            points = sorted(points, key=lambda r: r['num_nodes'])
+            # The default colour cycle repeats after ten series
+            linestyle = ['-', '--', ':'][i // 10 % 3]
+            ax.plot([r['num_nodes'] for r in points],
+                    [max(r[field] / scale, 1e-9) for r in points],
+                    marker='o', linestyle=linestyle, label=label)
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel('Number of Nodes')
+        ax.set_ylabel(ylabel)
+        ax.set_title(f'Scaling: {ylabel} vs Ring Size')
+        ax.grid(True, which='both', alpha=0.3)
+        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left', fontsize='small')
+        fig.savefig(f'{save_dir}/{filename}', bbox_inches='tight', dpi=150)
+        plt.close(fig)
+
+
+def positive_int(value):
+    """Parses an integer of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the ONoC routing, topology and export functions.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="ring sizes to benchmark")
+    parser.add_argument('--max-nodes', type=int,
+                        help="skip ring sizes above this value")
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS),
+                        help="run only these benchmarks")
+    parser.add_argument('--repeat', type=positive_int, default=5,
+                        help="minimum timed runs per measurement")
+    parser.add_argument('--min-time', type=float, default=0.5,
+                        help="keep repeating a measurement until this many seconds are spent")
+    parser.add_argument('--time-budget', type=float, default=2.0,
+                        help="stop repeating a measurement after this many seconds")
+    parser.add_argument('--recheck', type=int, default=2,
+                        help="re-measure flagged benchmarks this many times before reporting")
+    parser.add_argument('--baseline', default=BASELINE_PATH,
+                        help="baseline JSON to compare against or update")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="overwrite the baseline with this run instead of comparing")
+    parser.add_argument('--time-threshold', type=float, default=0.5,
+                        help="allowed fractional slowdown before flagging a regression")
+    parser.add_argument('--memory-threshold', type=float, default=0.25,
+                        help="allowed fractional memory growth before flagging a regression")
+    parser.add_argument('--output-dir', default=RESULTS_DIR,
+                        help="where to write the latest results and scaling plots")
+    parser.add_argument('--no-plots', action='store_true',
+                        help="skip generating scaling plots")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Runs the benchmark suite and returns a process exit status."""
+    args = parse_args(argv)
+    sizes = [n for n in args.sizes if args.max_nodes is None or n <= args.max_nodes]
+
+    records = run_benchmarks(sizes, args.only, args.repeat, args.time_budget, args.min_time)
+    compare = not args.save_baseline and os.path.exists(args.baseline)
+    if compare:
+        regressions = recheck_regressions(records, load_results(args.baseline), args)
+
+    # Saved after any re-check so latest.json holds the best measurement of each key
+    save_results(records, f'{args.output_dir}/latest.json')
+    if not args.no_plots:
+        plot_scaling(records, f'{args.output_dir}/plots')
+
+    if args.save_baseline:
+        save_results(records, args.baseline)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    if not compare:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    if not regressions:
+        print("\nNo regressions against baseline")
+        return 0
+
+    print(f"\n{len(regressions)} regression(s) against baseline:")
+    for r in regressions:
+        print(f"  {r['key']:<60} {r['metric']:<6} "
+              f"{r['baseline']:.6g} -> {r['current']:.6g} ({r['ratio']:.2f}x)")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
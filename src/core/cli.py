@@ -0,0 +1,286 @@
+"""Command-line entry point for the ONoC ring simulator.
+
+Only the standard library and the core topology and routing modules are
+imported up front. `route` and `sweep` run on the NetworkX-free ring from
+create_light_ring, so they never load NetworkX, NumPy, matplotlib or pandas.
+`export` and `plot` build the NetworkX topology and import the exporters and
+visualizer when they run.
+"""
+import argparse
+import csv
+import json
+import logging
+import random
+import sys
+
+from src.core.main import configure_logging, setup_directories, LOG_FILE
+from src.core.topology import create_ring_topology, create_light_ring, partition_nodes
+from src.core.routing import multicast_search, shortest_path_first
+from src.core.metrics import calculate_path_score
+
+SCENARIOS = ('high_congestion', 'hotspot')
+
+
+def node_list(value):
+    """Parses a comma-separated list of node indices."""
+    try:
+        return [int(x.strip()) for x in value.split(',') if x.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated integers, got {value!r}")
+
+
+def build_ring(num_nodes, scenario=None, seed=None, light=False):
+    """Creates the ring topology, seeding the random generators if asked.
+
+    With light=True the ring comes from create_light_ring, which avoids
+    importing NetworkX and NumPy.
+    """
+    if seed is not None:
+        random.seed(seed)
+    if light:
+        ring = create_light_ring(num_nodes)
+    else:
+        if seed is not None:
+            import numpy as np
+            np.random.seed(seed)
+        ring = create_ring_topology(num_nodes)
+    if scenario:
+        from src.test.test_scenarios import create_test_scenario_1, create_test_scenario_2
+        apply = {'high_congestion': create_test_scenario_1,
+                 'hotspot': create_test_scenario_2}[scenario]
+        ring = apply(ring)
+        logging.info(f"Applied test scenario: {scenario}")
+    return ring
+
+
+def run_routing(ring, sources, targets, wc, wt):
+    """Runs TempCon-RingCast and SPF on the ring."""
+    paths_tempcon, scores_tempcon = multicast_search(ring, sources, targets, wc, wt)
+    paths_spf, scores_spf = shortest_path_first(ring, sources, targets)
+    return paths_tempcon, scores_tempcon, paths_spf, scores_spf
+
+
+def validate(parser, num_nodes, sources, targets, wc, wt):
+    """Reports invalid simulation parameters through the subcommand's parser."""
+    if num_nodes < 3:
+        parser.error("number of nodes must be at least 3")
+    if not sources or not targets:
+        parser.error("at least one source and one target are required")
+    if not all(0 <= n < num_nodes for n in sources + targets):
+        parser.error(f"node indices must be between 0 and {num_nodes - 1}")
+    if not (0 <= wc <= 1 and 0 <= wt <= 1 and abs(wc + wt - 1) < 1e-6):
+        parser.error("weights must be between 0 and 1 and sum to 1")
+
+
+def cmd_route(args, parser):
+    """Prints the paths chosen by each algorithm with their weighted scores and hop counts."""
+    validate(parser, args.nodes, args.sources, args.targets, args.wc, args.wt)
+    ring = build_ring(args.nodes, args.scenario, args.seed, light=True)
+    paths_tempcon, scores_tempcon, paths_spf, _ = run_routing(
+        ring, args.sources, args.targets, args.wc, args.wt)
+
+    # shortest_path_first scores paths by length, so rescore SPF with the same
+    # weighted metric as TempCon-RingCast to keep the score column comparable
+    results = {}
+    if args.algorithm in ('tempcon', 'both'):
+        results['tempcon'] = [(source, path, score)
+                              for source in paths_tempcon
+                              for path, score in zip(paths_tempcon[source], scores_tempcon[source])]
+    if args.algorithm in ('spf', 'both'):
+        results['spf'] = [(source, path, calculate_path_score(ring, path, args.wc, args.wt))
+                          for source in paths_spf for path in paths_spf[source]]
+
+    if args.json:
+        payload = {
+            algo: [{'source': source, 'target': path[-1], 'path': path,
+                    'score': float(score), 'hops': len(path) - 1}
+                   for source, path, score in rows]
+            for algo, rows in results.items()
+        }
+        json.dump(payload, sys.stdout)
+        sys.stdout.write('\n')
+        return 0
+
+    print("algorithm\troute\tscore\thops\tpath")
+    for algo, rows in results.items():
+        for source, path, score in rows:
+            print(f"{algo}\t{source}->{path[-1]}\t{score:.6g}\t{len(path) - 1}\t"
+                  f"{'->'.join(map(str, path))}")
+    return 0
+
+
+def cmd_sweep(args, parser):
+    """Scores both algorithms over a grid of ring sizes and weights."""
+    fields = ['nodes', 'wc', 'wt', 'tempcon_score', 'spf_score',
+              'tempcon_hops', 'spf_hops']
+    for num_nodes in args.nodes:
+        for wc in args.wc:
+            validate(parser, num_nodes, args.sources, args.targets, wc, round(1 - wc, 10))
+
+    out = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        writer = csv.DictWriter(out, fieldnames=fields)
+        writer.writeheader()
+        for num_nodes in args.nodes:
+            # Score every weight on the same ring so only the weights vary
+            ring = build_ring(num_nodes, args.scenario, args.seed, light=True)
+            for wc in args.wc:
+                wt = round(1 - wc, 10)
+                paths_tempcon, scores_tempcon, paths_spf, _ = run_routing(
+                    ring, args.sources, args.targets, wc, wt)
+                spf_paths = [p for source in paths_spf for p in paths_spf[source]]
+                tempcon_paths = [p for source in paths_tempcon for p in paths_tempcon[source]]
+                writer.writerow({
+                    'nodes': num_nodes,
+                    'wc': wc,
+                    'wt': wt,
+                    'tempcon_score': float(sum(s for source in scores_tempcon
+                                               for s in scores_tempcon[source])),
+                    'spf_score': float(sum(calculate_path_score(ring, p, wc, wt)
+                                           for p in spf_paths)),
+                    'tempcon_hops': sum(len(p) - 1 for p in tempcon_paths),
+                    'spf_hops': sum(len(p) - 1 for p in spf_paths),
+                })
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    if args.output:
+        logging.info(f"Sweep results saved to {args.output}")
+    return 0
+
+
+def cmd_export(args, parser):
+    """Writes path, node and partition metrics to CSV files."""
+    from src.visualization.export import save_simulation_metrics, save_node_partition_metrics
+
+    validate(parser, args.nodes, args.sources, args.targets, args.wc, args.wt)
+    if not 0 < args.partition_size <= args.nodes:
+        parser.error("partition size must be between 1 and the number of nodes")
+    ring = build_ring(args.nodes, args.scenario, args.seed)
+    partitions = partition_nodes(ring, args.partition_size)
+    paths_tempcon, _, paths_spf, _ = run_routing(
+        ring, args.sources, args.targets, args.wc, args.wt)
+    save_simulation_metrics(ring, paths_tempcon, paths_spf, args.wc, args.wt, args.name)
+    save_node_partition_metrics(ring, partitions, args.name)
+    logging.info("Metrics exported successfully")
+    return 0
+
+
+def cmd_plot(args, parser):
+    """Renders the comparison plots, optionally opening the interactive view."""
+    import matplotlib
+    if not args.interactive:
+        matplotlib.use('Agg')
+    from src.visualization.visualizer import (visualize_topology,
+                                            visualize_metrics_comparison,
+                                            create_interactive_visualization)
+
+    validate(parser, args.nodes, args.sources, args.targets, args.wc, args.wt)
+    setup_directories()
+    ring = build_ring(args.nodes, args.scenario, args.seed)
+    paths_tempcon, _, paths_spf, _ = run_routing(
+        ring, args.sources, args.targets, args.wc, args.wt)
+    visualize_topology(ring, paths_tempcon, paths_spf, args.sources,
+                       args.targets, partition_size=None)
+    visualize_metrics_comparison(ring, paths_tempcon, paths_spf, args.wc, args.wt, args.name)
+    if args.interactive:
+        create_interactive_visualization(ring, paths_tempcon, paths_spf,
+                                         args.sources, args.targets)
+    logging.info("Plots saved successfully")
+    return 0
+
+
+def add_network_arguments(parser, sweep=False):
+    if sweep:
+        parser.add_argument('--nodes', type=int, nargs='+', default=[20],
+                            help="ring sizes to sweep (default: 20)")
+        parser.add_argument('--wc', type=float, nargs='+', default=[0.7],
+                            help="congestion weights to sweep; wt is 1 - wc (default: 0.7)")
+    else:
+        parser.add_argument('--nodes', type=int, default=20,
+                            help="number of nodes in the ring (default: 20)")
+        parser.add_argument('--wc', type=float, default=0.7,
+                            help="weight for congestion (default: 0.7)")
+        parser.add_argument('--wt', type=float,
+                            help="weight for temperature (default: 1 - wc)")
+    parser.add_argument('--sources', type=node_list, default=[0, 10],
+                        help="comma-separated source nodes (default: 0,10)")
+    parser.add_argument('--targets', type=node_list, default=[5, 15],
+                        help="comma-separated target nodes (default: 5,15)")
+    parser.add_argument('--scenario', choices=SCENARIOS,
+                        help="apply a test scenario to the topology")
+    parser.add_argument('--seed', type=int,
+                        help="seed the random topology for reproducible runs")
+
+
+def build_parser(prog=None):
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="ONoC ring topology simulator: TempCon-RingCast vs SPF.")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--log-level', default='INFO',
+                        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help="logging verbosity (default: INFO)")
+    common.add_argument('--log-file', metavar='PATH',
+                        help=f"also log to this file, e.g. {LOG_FILE}")
+    subparsers = parser.add_subparsers(dest='command', metavar='command')
+    subparsers.required = True
+
+    route = subparsers.add_parser('route', parents=[common],
+                                  help="print the chosen paths and scores")
+    add_network_arguments(route)
+    route.add_argument('--algorithm', choices=['tempcon', 'spf', 'both'], default='both',
+                       help="which algorithm's paths to print (default: both)")
+    route.add_argument('--json', action='store_true', help="print results as JSON")
+    route.set_defaults(func=cmd_route, parser=route)
+
+    sweep = subparsers.add_parser('sweep', parents=[common],
+                                  help="compare algorithms over ring sizes and weights")
+    add_network_arguments(sweep, sweep=True)
+    sweep.add_argument('--output', help="write CSV to this file instead of stdout")
+    sweep.set_defaults(func=cmd_sweep, parser=sweep)
+
+    export = subparsers.add_parser('export', parents=[common],
+                                   help="save path, node and partition metrics to CSV")
+    add_network_arguments(export)
+    export.add_argument('--partition-size', type=int, default=5,
+                        help="nodes per partition (default: 5)")
+    export.add_argument('--name', help="test name; saves under results/test/metrics")
+    export.set_defaults(func=cmd_export, parser=export)
+
+    plot = subparsers.add_parser('plot', parents=[common],
+                                 help="render comparison plots")
+    add_network_arguments(plot)
+    plot.add_argument('--name', help="test name; saves under results/test")
+    plot.add_argument('--interactive', action='store_true',
+                      help="also open the interactive path viewer")
+    plot.set_defaults(func=cmd_plot, parser=plot)
+
+    return parser
+
+
+def module_prog():
+    """Names the program after the module run with `python -m`, if any."""
+    spec = getattr(sys.modules.get('__main__'), '__spec__', None)
+    return f"python -m {spec.name}" if spec and spec.name.startswith('src.') else None
+
+
+def main(argv=None):
+    """Parses arguments, configures logging and runs the chosen subcommand.
+
+    Subcommands report invalid parameters through their own subparser so the
+    error shows that subcommand's usage.
+    """
+    args = build_parser(module_prog()).parse_args(argv)
+    if getattr(args, 'wt', 0) is None:
+        args.wt = round(1 - args.wc, 10)
+    configure_logging(getattr(logging, args.log_level), args.log_file)
+    try:
+        return args.func(args, args.parser)
+    except Exception as e:
+        logging.exception(f"{args.command} failed: {str(e)}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,21 @@
 from src.core.topology import create_ring_topology, partition_nodes
 from src.core.routing import multicast_search, shortest_path_first
-from src.visualization.visualizer import (visualize_topology, 
-                                        visualize_metrics_comparison,
-                                        create_interactive_visualization,
-                                        save_simulation_metrics,
-                                        save_node_partition_metrics)
-from src.test.test_scenarios import create_test_scenario_1, create_test_scenario_2
 import logging
 import os
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('results/simulation.log'),
-        logging.StreamHandler()
-    ]
-)
+LOG_FILE = 'results/simulation.log'
+
+def configure_logging(level=logging.INFO, log_file=LOG_FILE):
+    """Configures logging to stderr and, if log_file is given, to that file."""
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        os.makedirs(os.path.dirname(log_file) or '.', exist_ok=True)
+        handlers.append(logging.FileHandler(log_file))
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=handlers
+    )
 
 def setup_directories():
     """Create necessary directories if they don't exist."""
@@ -33,6 +31,12 @@ def setup_directories():
 
 def main(num_nodes, partition_size, wc, wt, sources, targets, test_scenario=None, test_name=None):
     """Main simulation function with improved error handling and logging."""
+    # Imported here so routing-only callers never pay for matplotlib/pandas
+    from src.visualization.visualizer import (visualize_topology,
+                                            visualize_metrics_comparison,
+                                            create_interactive_visualization,
+                                            save_simulation_metrics,
+                                            save_node_partition_metrics)
     setup_directories()
     logging.info("Starting simulation with parameters: "
                 f"nodes={num_nodes}, partition_size={partition_size}, "
@@ -74,6 +78,6 @@ def main(num_nodes, partition_size, wc, wt, sources, targets, test_scenario=None
         raise
 
 if __name__ == "__main__":
-    sources = [0, 10]
-    targets = [5, 15]
-    main(20, 5, 0.7, 0.3, sources, targets)
\ No newline at end of file
+    import sys
+    from src.core.cli import main as cli_main
+    sys.exit(cli_main())
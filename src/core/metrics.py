@@ -1,5 +1,3 @@
-import numpy as np
-
 def calculate_temperature(delta_lambda, alpha=1.86e-4, lambda_o=1550, T_o=25):
     """Calculates the temperature from the resonant wavelength shift."""
     if not isinstance(delta_lambda, (int, float)) or delta_lambda < 0:
@@ -30,8 +28,10 @@ def calculate_path_score(graph, path, wc, wt):
     temperature = sum(graph.nodes[node]['temperature'] for node in path)
     
     # Normalize scores
-    avg_congestion = np.mean([graph[u][v]['utilization'] for u, v in graph.edges])
-    avg_temperature = np.mean([graph.nodes[n]['temperature'] for n in graph.nodes])
+    utilizations = [graph[u][v]['utilization'] for u, v in graph.edges]
+    temperatures = [graph.nodes[n]['temperature'] for n in graph.nodes]
+    avg_congestion = sum(utilizations) / len(utilizations)
+    avg_temperature = sum(temperatures) / len(temperatures)
     
     normalized_congestion = congestion / (len(path) * avg_congestion)
     normalized_temperature = temperature / (len(path) * avg_temperature)
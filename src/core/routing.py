@@ -1,6 +1,5 @@
 from heapq import heappop, heappush
 from src.core.metrics import calculate_path_score
-import networkx as nx
 
 def find_best_path(graph, source, target, wc, wt):
     """Finds the best path using a weighted metric."""
@@ -1,9 +1,11 @@
-import networkx as nx
 import random
-import numpy as np
 
 def create_ring_topology(num_nodes):
     """Creates a ring topology with the given number of nodes."""
+    # Imported here so routing-only callers can use create_light_ring instead
+    import networkx as nx
+    import numpy as np
+
     ring = nx.cycle_graph(num_nodes)
     
     # Initialize with more realistic temperature distribution
@@ -21,6 +23,92 @@ def create_ring_topology(num_nodes):
         
     return ring
 
+class _NodeView:
+    """Node ids on iteration, attribute dicts on indexing, like graph.nodes in NetworkX."""
+
+    def __init__(self, attrs):
+        self._attrs = attrs
+
+    def __getitem__(self, node):
+        return self._attrs[node]
+
+    def __iter__(self):
+        return iter(range(len(self._attrs)))
+
+    def __len__(self):
+        return len(self._attrs)
+
+    def __call__(self):
+        return self
+
+class _EdgeView:
+    """Iterates (u, v) pairs; callable like graph.edges in NetworkX."""
+
+    def __init__(self, edges):
+        self._edges = edges
+
+    def __iter__(self):
+        return iter(self._edges)
+
+    def __len__(self):
+        return len(self._edges)
+
+    def __call__(self):
+        return self
+
+class RingGraph:
+    """Minimal undirected ring supporting the graph interface used by routing.
+
+    Exposes len(), nodes, edges, neighbors(), has_edge() and graph[u][v] with
+    the same attribute layout as create_ring_topology, without NetworkX.
+    Both directions of an edge share one attribute dict, and neighbors and
+    edges come out in the same order as nx.cycle_graph, so scores match a
+    NetworkX ring carrying the same attributes exactly.
+    """
+
+    def __init__(self, num_nodes):
+        if num_nodes < 1:
+            raise ValueError("Ring must have at least one node")
+        self._adj = [{} for _ in range(num_nodes)]
+        for u in range(num_nodes):
+            v = (u + 1) % num_nodes
+            if v not in self._adj[u]:
+                attrs = {}
+                self._adj[u][v] = attrs
+                self._adj[v][u] = attrs
+        # Each edge reported once, from its lower-numbered end
+        edges = [(u, v) for u in range(num_nodes) for v in self._adj[u] if v >= u]
+        self.nodes = _NodeView([{} for _ in range(num_nodes)])
+        self.edges = _EdgeView(edges)
+
+    def __len__(self):
+        return len(self._adj)
+
+    def __getitem__(self, node):
+        return self._adj[node]
+
+    def neighbors(self, node):
+        return iter(self._adj[node])
+
+    def has_edge(self, u, v):
+        return 0 <= u < len(self._adj) and v in self._adj[u]
+
+def create_light_ring(num_nodes):
+    """Creates a ring like create_ring_topology without importing NetworkX or NumPy.
+
+    Temperatures come from random.gauss, so a given seed yields a different
+    topology than create_ring_topology does.
+    """
+    ring = RingGraph(num_nodes)
+    for node in ring.nodes:
+        ring.nodes[node]['temperature'] = min(max(random.gauss(35, 5), 25), 50)
+        ring.nodes[node]['congestion'] = random.uniform(20, 60)
+
+    for u, v in ring.edges:
+        ring[u][v]['utilization'] = random.uniform(20, 60)
+
+    return ring
+
 def partition_nodes(graph, partition_size):
     """Partitions the nodes into groups of the given size."""
     if partition_size <= 0 or partition_size > len(graph):
@@ -6,7 +6,7 @@ import os
 # Add project root to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from src.core.main import main
+from src.core.main import main, configure_logging
 
 def validate_inputs(values):
     """Validates user inputs and returns processed values."""
@@ -90,4 +90,5 @@ run_button = ttk.Button(frame, text="Run Simulation", command=run_simulation)
 run_button.grid(column=0, row=6, columnspan=2, pady=10)
 
 if __name__ == "__main__":
+    configure_logging()
     root.mainloop()
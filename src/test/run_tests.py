@@ -1,4 +1,4 @@
-from src.core.main import main
+from src.core.main import main, configure_logging
 from src.test.test_scenarios import create_test_scenario_1, create_test_scenario_2
 
 def run_all_tests():
@@ -25,4 +25,5 @@ def run_all_tests():
             print(f"{test['name']} failed: {str(e)}")
 
 if __name__ == "__main__":
+    configure_logging()
     run_all_tests()
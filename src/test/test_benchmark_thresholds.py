@@ -0,0 +1,67 @@
+from src.benchmark.benchmarks import measure
+from src.benchmark.run_benchmarks import compare_to_baseline, MIN_TIME_DELTA, MIN_MEMORY_DELTA
+
+def record(min_s, peak_bytes=1_000_000, median_s=None, benchmark='multicast_search', num_nodes=1000):
+    """Builds a plain benchmark record with no run-to-run spread unless median_s is given."""
+    return {
+        'benchmark': benchmark,
+        'num_nodes': num_nodes,
+        'num_sources': 1,
+        'num_targets': 1,
+        'runs': 5,
+        'min_s': min_s,
+        'median_s': min_s if median_s is None else median_s,
+        'peak_bytes': peak_bytes,
+    }
+
+def test_slowdown_over_threshold_is_flagged():
+    regressions = compare_to_baseline([record(0.2)], [record(0.1)], time_threshold=0.5)
+    assert [(r['metric'], r['ratio']) for r in regressions] == [('time', 2.0)]
+
+def test_slowdown_under_threshold_is_ignored():
+    assert compare_to_baseline([record(0.14)], [record(0.1)], time_threshold=0.5) == []
+
+def test_slowdown_under_absolute_floor_is_ignored():
+    before = MIN_TIME_DELTA / 10
+    after = before + MIN_TIME_DELTA / 2  # far over threshold in relative terms
+    assert compare_to_baseline([record(after)], [record(before)], time_threshold=0.5) == []
+
+def test_memory_growth_under_floor_is_ignored():
+    before = MIN_MEMORY_DELTA // 4
+    after = before + MIN_MEMORY_DELTA // 2
+    assert compare_to_baseline([record(0.1, after)], [record(0.1, before)]) == []
+
+def test_memory_growth_over_threshold_is_flagged():
+    regressions = compare_to_baseline([record(0.1, 4_000_000)], [record(0.1, 1_000_000)],
+                                      memory_threshold=0.25)
+    assert [r['metric'] for r in regressions] == ['memory']
+
+def test_noisy_measurement_widens_threshold():
+    # The baseline median sat 60% above its fastest run, so a 1.8x slowdown
+    # is within 0.5 + 0.6 of noise and must not be flagged
+    baseline = [record(0.1, median_s=0.16)]
+    assert compare_to_baseline([record(0.18)], baseline, time_threshold=0.5) == []
+    assert compare_to_baseline([record(0.25)], baseline, time_threshold=0.5) != []
+
+def test_missing_key_is_skipped():
+    current = [record(1.0, benchmark='find_best_path')]
+    assert compare_to_baseline(current, [record(0.1)]) == []
+    assert compare_to_baseline([record(1.0, num_nodes=20)], [record(0.1)]) == []
+
+def test_zero_baseline_gives_infinite_ratio():
+    regressions = compare_to_baseline([record(0.1, peak_bytes=1_000_000)],
+                                      [record(0.0, peak_bytes=0)])
+    assert {r['metric'] for r in regressions} == {'time', 'memory'}
+    assert all(r['ratio'] == float('inf') for r in regressions)
+
+def test_measure_always_runs_at_least_once():
+    calls = []
+    result = measure(lambda: calls.append(1), repeat=0, time_budget=0, min_time=0)
+    assert result['runs'] == 1
+    assert len(calls) == 2  # one timed run plus the tracemalloc run
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"{name} passed")
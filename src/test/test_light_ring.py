@@ -0,0 +1,55 @@
+import random
+
+import networkx as nx
+
+from src.core.topology import RingGraph, create_light_ring, partition_nodes
+from src.core.routing import multicast_search, shortest_path_first, find_best_path
+from src.test.test_scenarios import create_test_scenario_1, create_test_scenario_2
+
+def networkx_copy(ring):
+    """Builds a NetworkX cycle graph carrying the same attributes as a light ring."""
+    graph = nx.cycle_graph(len(ring))
+    for node in graph.nodes:
+        graph.nodes[node].update(ring.nodes[node])
+    for u, v in graph.edges:
+        graph[u][v]['utilization'] = ring[u][v]['utilization']
+    return graph
+
+def test_structure_matches_cycle_graph():
+    for num_nodes in (1, 2, 3, 20):
+        ring, graph = RingGraph(num_nodes), nx.cycle_graph(num_nodes)
+        assert len(ring) == len(graph)
+        assert list(ring.nodes) == list(graph.nodes)
+        assert list(ring.edges) == list(graph.edges)
+        for node in graph.nodes:
+            assert list(ring.neighbors(node)) == list(graph.neighbors(node))
+
+def test_edge_attributes_are_shared_between_directions():
+    ring = RingGraph(5)
+    ring[0][1]['utilization'] = 42.0
+    assert ring[1][0]['utilization'] == 42.0
+    assert ring.has_edge(4, 0) and not ring.has_edge(0, 2)
+
+def test_routing_matches_networkx():
+    random.seed(7)
+    ring = create_light_ring(30)
+    graph = networkx_copy(ring)
+    for scenario in (lambda g: g, create_test_scenario_1, create_test_scenario_2):
+        light, full = scenario(ring), scenario(graph)
+        assert (multicast_search(light, [0, 10], [5, 25], 0.6, 0.4) ==
+                multicast_search(full, [0, 10], [5, 25], 0.6, 0.4))
+        assert (shortest_path_first(light, [0, 10], [5, 25]) ==
+                shortest_path_first(full, [0, 10], [5, 25]))
+        assert find_best_path(light, 0, 17, 0.6, 0.4) == find_best_path(full, 0, 17, 0.6, 0.4)
+        assert partition_nodes(light, 7) == partition_nodes(full, 7)
+
+def test_temperatures_are_clipped():
+    random.seed(0)
+    ring = create_light_ring(1000)
+    assert all(25 <= ring.nodes[n]['temperature'] <= 50 for n in ring.nodes)
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"{name} passed")
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import os
+
+def save_simulation_metrics(graph, paths_tempcon, paths_spf, wc, wt, test_name=None):
+    """Saves detailed simulation metrics to CSV files."""
+    # Prepare metrics for both algorithms
+    metrics = {
+        'TempCon': [],
+        'SPF': []
+    }
+    
+    for algo, paths in [('TempCon', paths_tempcon), ('SPF', paths_spf)]:
+        for source in paths:
+            for path in paths[source]:
+                path_metrics = {
+                    'Source': source,
+                    'Path': '->'.join(map(str, path)),
+                    'Path_Length': len(path),
+                    'Avg_Temperature': np.mean([graph.nodes[n]['temperature'] for n in path]),
+                    'Max_Temperature': max([graph.nodes[n]['temperature'] for n in path]),
+                    'Avg_Congestion': np.mean([graph[u][v]['utilization'] 
+                                             for u, v in zip(path[:-1], path[1:])]),
+                    'Max_Congestion': max([graph[u][v]['utilization'] 
+                                         for u, v in zip(path[:-1], path[1:])])
+                }
+                
+                # Calculate weighted score
+                path_metrics['Weighted_Score'] = (
+                    wc * path_metrics['Avg_Congestion'] + 
+                    wt * path_metrics['Avg_Temperature']
+                )
+                
+                metrics[algo].append(path_metrics)
+    
+    # Save to CSV
+    save_dir = 'results/test/metrics' if test_name else 'results/metrics'
+    os.makedirs(save_dir, exist_ok=True)
+    
+    for algo, data in metrics.items():
+        filename = f'{test_name}_{algo.lower()}_metrics.csv' if test_name else f'{algo.lower()}_metrics.csv'
+        pd.DataFrame(data).to_csv(f'{save_dir}/{filename}', index=False)
+
+def save_node_partition_metrics(graph, partitions, test_name=None):
+    """Saves node and partition level metrics to CSV files."""
+    # Node metrics
+    node_metrics = []
+    for node in graph.nodes():
+        node_data = {
+            'Node_ID': node,
+            'Temperature': graph.nodes[node]['temperature'],
+            'Partition': next((i for i, p in enumerate(partitions) if node in p), None),
+            'Avg_Edge_Congestion': np.mean([graph[node][neighbor]['utilization'] 
+                                          for neighbor in graph.neighbors(node)])
+        }
+        node_metrics.append(node_data)
+    
+    # Partition metrics
+    partition_metrics = []
+    for i, partition in enumerate(partitions):
+        partition_data = {
+            'Partition_ID': i,
+            'Nodes': ','.join(map(str, partition)),
+            'Avg_Temperature': np.mean([graph.nodes[n]['temperature'] for n in partition]),
+            'Max_Temperature': max([graph.nodes[n]['temperature'] for n in partition]),
+            'Avg_Congestion': np.mean([graph[u][v]['utilization'] 
+                                     for u in partition for v in graph.neighbors(u)])
+        }
+        partition_metrics.append(partition_data)
+    
+    # Save to CSV
+    save_dir = 'results/test/metrics' if test_name else 'results/metrics'
+    os.makedirs(save_dir, exist_ok=True)
+    
+    # Save node metrics
+    node_filename = f'{test_name}_node_metrics.csv' if test_name else 'node_metrics.csv'
+    pd.DataFrame(node_metrics).to_csv(f'{save_dir}/{node_filename}', index=False)
+    
+    # Save partition metrics
+    partition_filename = f'{test_name}_partition_metrics.csv' if test_name else 'partition_metrics.csv'
+    pd.DataFrame(partition_metrics).to_csv(f'{save_dir}/{partition_filename}', index=False)
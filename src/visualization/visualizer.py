@@ -3,7 +3,9 @@ import networkx as nx
 import numpy as np
 import pandas as pd
 from matplotlib.patches import FancyArrowPatch
-import os
+
+# CSV exporters live in their own module so they can be used without matplotlib
+from src.visualization.export import save_simulation_metrics, save_node_partition_metrics
 
 def visualize_topology(graph, paths_tempcon, paths_spf, sources, targets, partition_size):
     """Visualizes the ring topology with temperatures and highlights the best paths."""
@@ -56,7 +58,7 @@ def visualize_metrics_comparison(graph, paths_tempcon, paths_spf, wc, wt, test_n
         'SPF': [graph.nodes[n]['temperature'] for source in paths_spf 
                 for path in paths_spf[source] for n in path]
     }
-    ax1.boxplot([temp_data['TempCon'], temp_data['SPF']], labels=['TempCon', 'SPF'])
+    ax1.boxplot([temp_data['TempCon'], temp_data['SPF']], tick_labels=['TempCon', 'SPF'])
     ax1.set_title('Temperature Distribution')
     ax1.set_ylabel('Temperature (°C)')
     
@@ -191,81 +193,3 @@ def create_interactive_visualization(graph, paths_tempcon, paths_spf, sources, t
     
     fig.canvas.mpl_connect('button_press_event', on_click)
     plt.show()
-
-def save_simulation_metrics(graph, paths_tempcon, paths_spf, wc, wt, test_name=None):
-    """Saves detailed simulation metrics to CSV files."""
-    # Prepare metrics for both algorithms
-    metrics = {
-        'TempCon': [],
-        'SPF': []
-    }
-    
-    for algo, paths in [('TempCon', paths_tempcon), ('SPF', paths_spf)]:
-        for source in paths:
-            for path in paths[source]:
-                path_metrics = {
-                    'Source': source,
-                    'Path': '->'.join(map(str, path)),
-                    'Path_Length': len(path),
-                    'Avg_Temperature': np.mean([graph.nodes[n]['temperature'] for n in path]),
-                    'Max_Temperature': max([graph.nodes[n]['temperature'] for n in path]),
-                    'Avg_Congestion': np.mean([graph[u][v]['utilization'] 
-                                             for u, v in zip(path[:-1], path[1:])]),
-                    'Max_Congestion': max([graph[u][v]['utilization'] 
-                                         for u, v in zip(path[:-1], path[1:])])
-                }
-                
-                # Calculate weighted score
-                path_metrics['Weighted_Score'] = (
-                    wc * path_metrics['Avg_Congestion'] + 
-                    wt * path_metrics['Avg_Temperature']
-                )
-                
-                metrics[algo].append(path_metrics)
-    
-    # Save to CSV
-    save_dir = 'results/test/metrics' if test_name else 'results/metrics'
-    os.makedirs(save_dir, exist_ok=True)
-    
-    for algo, data in metrics.items():
-        filename = f'{test_name}_{algo.lower()}_metrics.csv' if test_name else f'{algo.lower()}_metrics.csv'
-        pd.DataFrame(data).to_csv(f'{save_dir}/{filename}', index=False)
-
-def save_node_partition_metrics(graph, partitions, test_name=None):
-    """Saves node and partition level metrics to CSV files."""
-    # Node metrics
-    node_metrics = []
-    for node in graph.nodes():
-        node_data = {
-            'Node_ID': node,
-            'Temperature': graph.nodes[node]['temperature'],
-            'Partition': next((i for i, p in enumerate(partitions) if node in p), None),
-            'Avg_Edge_Congestion': np.mean([graph[node][neighbor]['utilization'] 
-                                          for neighbor in graph.neighbors(node)])
-        }
-        node_metrics.append(node_data)
-    
-    # Partition metrics
-    partition_metrics = []
-    for i, partition in enumerate(partitions):
-        partition_data = {
-            'Partition_ID': i,
-            'Nodes': ','.join(map(str, partition)),
-            'Avg_Temperature': np.mean([graph.nodes[n]['temperature'] for n in partition]),
-            'Max_Temperature': max([graph.nodes[n]['temperature'] for n in partition]),
-            'Avg_Congestion': np.mean([graph[u][v]['utilization'] 
-                                     for u in partition for v in graph.neighbors(u)])
-        }
-        partition_metrics.append(partition_data)
-    
-    # Save to CSV
-    save_dir = 'results/test/metrics' if test_name else 'results/metrics'
-    os.makedirs(save_dir, exist_ok=True)
-    
-    # Save node metrics
-    node_filename = f'{test_name}_node_metrics.csv' if test_name else 'node_metrics.csv'
-    pd.DataFrame(node_metrics).to_csv(f'{save_dir}/{node_filename}', index=False)
-    
-    # Save partition metrics
-    partition_filename = f'{test_name}_partition_metrics.csv' if test_name else 'partition_metrics.csv'
-    pd.DataFrame(partition_metrics).to_csv(f'{save_dir}/{partition_filename}', index=False)
\ No newline at end of file